@@ -1,92 +1,348 @@
 from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, EmailStr, field_validator
 from datetime import datetime, timezone
 import sqlite3
 import logging
+import os
+import queue
+import threading
+import time
+from functools import lru_cache
 from typing import List, Optional
-import pytz
+from zoneinfo import ZoneInfo, available_timezones
+from cachetools import TTLCache
 from contextlib import asynccontextmanager, contextmanager
 
+@lru_cache(maxsize=64)
+def _zi(name: str) -> ZoneInfo:
+    """Load a timezone once and reuse it for every later lookup"""
+    return ZoneInfo(name)
+
+_IST = _zi('Asia/Kolkata')
+_UTC = timezone.utc
+_VALID_TZS = frozenset(available_timezones())
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup"""
+    """Initialize database pool on startup and close it on shutdown"""
+    get_db_pool()
     init_db()
     yield
+    close_db_pool()
 
-app = FastAPI(title="Fitness Studio Booking API", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="Fitness Studio Booking API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Database setup
 DATABASE_URL = "fitness_studio.db"
+DB_POOL_SIZE = 5
+
+# Applied once to every new connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Per-connection prepared statement cache size
+DB_CACHED_STATEMENTS = 256
+
+# Short-lived cache of /classes responses, cleared whenever slots change
+CLASSES_CACHE_TTL = 5
+_classes_cache = TTLCache(maxsize=64, ttl=CLASSES_CACHE_TTL)
+_classes_cache_lock = threading.Lock()
+# Bumped on every clear so reads that started before a write don't store stale rows
+_classes_cache_generation = 0
+
+def clear_classes_cache():
+    """Drop every cached /classes response"""
+    global _classes_cache_generation
+    with _classes_cache_lock:
+        _classes_cache_generation += 1
+        _classes_cache.clear()
+
+# Request-path SQL, kept as module constants so each connection prepares them once
+SQL_GET_CLASSES = '''
+    SELECT id, name, instructor, datetime, total_slots, available_slots
+    FROM classes
+    WHERE datetime > ?
+    ORDER BY datetime
+'''
+
+SQL_DEC_SLOTS = '''
+    UPDATE classes
+    SET available_slots = available_slots - 1
+    WHERE id = ? AND datetime > ? AND available_slots > 0
+    RETURNING name, instructor, datetime
+'''
+
+SQL_GET_CLASS_FOR_BOOK = '''
+    SELECT 1 FROM classes
+    WHERE id = ? AND datetime > ?
+'''
+
+SQL_INSERT_BOOKING = '''
+    INSERT INTO bookings (class_id, client_name, client_email, booking_time)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT (class_id, client_email) DO NOTHING
+'''
+
+SQL_GET_BOOKINGS = '''
+    SELECT 
+        b.id, b.class_id, b.client_name, b.client_email, b.booking_time,
+        c.name as class_name, c.instructor, c.datetime as class_datetime
+    FROM bookings b
+    JOIN classes c ON b.class_id = c.id
+    WHERE b.client_email = ?
+    ORDER BY c.datetime DESC
+'''
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived SQLite connections"""
+
+    def __init__(self, database: str, size: int = DB_POOL_SIZE):
+        self.database = database
+        self._closed = False
+        self._lock = threading.Lock()
+        self._connections = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._connections.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.database,
+            check_same_thread=False,
+            cached_statements=DB_CACHED_STATEMENTS,
+            uri=True,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        return self._connections.get()
+
+    def put(self, conn: sqlite3.Connection):
+        # Connections returned after close() are closed instead of pooled
+        with self._lock:
+            if not self._closed:
+                self._connections.put(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Close idle connections now and checked-out ones when they are returned"""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._connections.get_nowait().close()
+            except queue.Empty:
+                break
+
+_pool_lock = threading.Lock()
+
+def get_db_pool() -> ConnectionPool:
+    """Return the application connection pool, creating it on first use"""
+    with _pool_lock:
+        pool = getattr(app.state, "db_pool", None)
+        if pool is None:
+            pool = app.state.db_pool = ConnectionPool(DATABASE_URL)
+        return pool
+
+def close_db_pool():
+    """Close the application connection pool if one is open"""
+    with _pool_lock:
+        pool = getattr(app.state, "db_pool", None)
+        if pool is not None:
+            pool.close()
+            app.state.db_pool = None
 
 def init_db():
     """Initialize the database with tables and seed data"""
-    conn = sqlite3.connect(DATABASE_URL)
-    cursor = conn.cursor()
-    
-    # Create classes table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS classes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            instructor TEXT NOT NULL,
-            datetime TEXT NOT NULL,
-            total_slots INTEGER NOT NULL,
-            available_slots INTEGER NOT NULL,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
+    with get_db() as conn:
+        cursor = conn.cursor()
+        migrate_legacy = _has_legacy_tables(cursor)
+        if migrate_legacy:
+            # Foreign keys stay off until the rows are copied into the new tables
+            cursor.execute("PRAGMA foreign_keys=OFF")
+        
+        try:
+            if migrate_legacy:
+                _detach_legacy_tables(cursor)
+        
+            # Create classes table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS classes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    instructor TEXT NOT NULL,
+                    datetime INTEGER NOT NULL,
+                    total_slots INTEGER NOT NULL,
+                    available_slots INTEGER NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
     
-    # Create bookings table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS bookings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            class_id INTEGER NOT NULL,
-            client_name TEXT NOT NULL,
-            client_email TEXT NOT NULL,
-            booking_time TEXT DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (class_id) REFERENCES classes (id)
-        )
-    ''')
+            # Create bookings table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS bookings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    class_id INTEGER NOT NULL,
+                    client_name TEXT NOT NULL,
+                    client_email TEXT NOT NULL,
+                    booking_time INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                    FOREIGN KEY (class_id) REFERENCES classes (id)
+                )
+            ''')
+            
+            if migrate_legacy:
+                _copy_legacy_tables(cursor)
+                conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            if migrate_legacy:
+                # Only takes effect outside a transaction, hence after commit/rollback
+                cursor.execute("PRAGMA foreign_keys=ON")
+
+        # Indexes for upcoming-class listing, booking lookups and duplicate checks
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_classes_datetime ON classes (datetime)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_bookings_email_class ON bookings (client_email, class_id)
+        ''')
+        _dedupe_bookings(cursor)
+        cursor.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_bookings_unique ON bookings (class_id, client_email)
+        ''')
     
-    # Insert seed data (classes in IST)
-    ist = pytz.timezone('Asia/Kolkata')
-    seed_classes = [
-        ("Yoga Flow", "Priya Sharma", "2025-06-09 07:00:00", 20, 20),
-        ("Zumba Dance", "Rahul Kumar", "2025-06-09 18:30:00", 25, 25),
-        ("HIIT Training", "Anjali Singh", "2025-06-10 06:30:00", 15, 15),
-        ("Power Yoga", "Priya Sharma", "2025-06-10 19:00:00", 20, 20),
-        ("Cardio Blast", "Vikram Patel", "2025-06-11 07:30:00", 18, 18),
-    ]
+        # Insert seed data (classes scheduled in IST, stored as unix seconds)
+        seed_classes = [
+            ("Yoga Flow", "Priya Sharma", "2025-06-09 07:00:00", 20, 20),
+            ("Zumba Dance", "Rahul Kumar", "2025-06-09 18:30:00", 25, 25),
+            ("HIIT Training", "Anjali Singh", "2025-06-10 06:30:00", 15, 15),
+            ("Power Yoga", "Priya Sharma", "2025-06-10 19:00:00", 20, 20),
+            ("Cardio Blast", "Vikram Patel", "2025-06-11 07:30:00", 18, 18),
+        ]
     
-    for name, instructor, dt_str, total, available in seed_classes:
-        # Convert to IST timezone aware datetime
-        naive_dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
-        ist_dt = ist.localize(naive_dt)
+        # Convert IST wall-clock times to unix seconds up front
+        rows = [
+            (name, instructor,
+             int(datetime.fromisoformat(dt_str).replace(tzinfo=_IST).timestamp()),
+             total, available)
+            for name, instructor, dt_str, total, available in seed_classes
+        ]
         
-        cursor.execute('''
+        # One batched statement inside a single transaction
+        cursor.executemany('''
             INSERT OR IGNORE INTO classes (name, instructor, datetime, total_slots, available_slots)
             VALUES (?, ?, ?, ?, ?)
-        ''', (name, instructor, ist_dt.isoformat(), total, available))
+        ''', rows)
     
-    conn.commit()
-    conn.close()
+        conn.commit()
+    clear_classes_cache()
     logger.info("Database initialized with seed data")
 
+def _dedupe_bookings(cursor: sqlite3.Cursor):
+    """Drop duplicate bookings made before the unique index existed"""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_bookings_unique'")
+    if cursor.fetchone():
+        return
+    
+    # Keep the earliest booking per (class_id, client_email) and give back the extra slots
+    cursor.execute('''
+        UPDATE classes
+        SET available_slots = MIN(total_slots, available_slots + (
+            SELECT COUNT(*) FROM bookings b
+            WHERE b.class_id = classes.id
+              AND b.id NOT IN (SELECT MIN(id) FROM bookings GROUP BY class_id, client_email)
+        ))
+        WHERE id IN (
+            SELECT class_id FROM bookings
+            GROUP BY class_id, client_email
+            HAVING COUNT(*) > 1
+        )
+    ''')
+    cursor.execute('''
+        DELETE FROM bookings
+        WHERE id NOT IN (SELECT MIN(id) FROM bookings GROUP BY class_id, client_email)
+    ''')
+    if cursor.rowcount:
+        logger.warning("Removed %d duplicate bookings before creating idx_bookings_unique", cursor.rowcount)
+
+def _has_legacy_tables(cursor: sqlite3.Cursor) -> bool:
+    """Whether the classes table still stores ISO text timestamps"""
+    cursor.execute("PRAGMA table_info(classes)")
+    return any(col['name'] == 'datetime' and col['type'] == 'TEXT' for col in cursor.fetchall())
+
+def _detach_legacy_tables(cursor: sqlite3.Cursor):
+    """Rename the legacy tables out of the way inside a new transaction"""
+    cursor.execute("BEGIN")
+    cursor.execute("ALTER TABLE bookings RENAME TO bookings_legacy")
+    cursor.execute("ALTER TABLE classes RENAME TO classes_legacy")
+    for index in ("idx_classes_datetime", "idx_bookings_email_class", "idx_bookings_unique"):
+        cursor.execute(f"DROP INDEX IF EXISTS {index}")
+
+def _copy_legacy_tables(cursor: sqlite3.Cursor):
+    """Copy legacy rows into the new tables, converting timestamps to unix seconds"""
+    cursor.execute('''
+        INSERT INTO classes (id, name, instructor, datetime, total_slots, available_slots, created_at)
+        SELECT id, name, instructor, CAST(strftime('%s', datetime) AS INTEGER),
+               total_slots, available_slots, created_at
+        FROM classes_legacy
+    ''')
+    cursor.execute('''
+        INSERT INTO bookings (id, class_id, client_name, client_email, booking_time)
+        SELECT id, class_id, client_name, client_email, CAST(strftime('%s', booking_time) AS INTEGER)
+        FROM bookings_legacy
+    ''')
+    cursor.execute("DROP TABLE bookings_legacy")
+    cursor.execute("DROP TABLE classes_legacy")
+
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+# Set LOG_LEVEL=WARNING in production to drop the per-request INFO lines
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+_log_level_known = LOG_LEVEL in logging.getLevelNamesMapping()
+logging.basicConfig(level=LOG_LEVEL if _log_level_known else logging.INFO)
 logger = logging.getLogger(__name__)
+if not _log_level_known:
+    logger.warning("Unknown LOG_LEVEL %r, falling back to INFO", LOG_LEVEL)
 
 @contextmanager
 def get_db():
-    """Database connection context manager"""
-    conn = sqlite3.connect(DATABASE_URL)
-    conn.row_factory = sqlite3.Row
+    """Borrow a pooled database connection, rolling back on error"""
+    pool = get_db_pool()
+    conn = pool.get()
     try:
         yield conn
+    except Exception:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        pool.put(conn)
+
+def iter_rows(cursor: sqlite3.Cursor, size: int = 256):
+    """Yield query results in fetchmany() batches instead of materializing them"""
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        yield from rows
 
 # Pydantic models
+# Read endpoints return plain dicts; the response models only document them
 class ClassResponse(BaseModel):
     id: int
     name: str
@@ -116,25 +372,17 @@ class BookingResponse(BaseModel):
     client_email: str
     booking_time: str
 
-def convert_timezone(dt_str: str, target_tz: str = "UTC") -> str:
-    """Convert datetime from IST to target timezone"""
-    try:
-        # Parse the ISO format datetime
-        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-        
-        # If datetime is naive, assume it's in IST
-        if dt.tzinfo is None:
-            ist = pytz.timezone('Asia/Kolkata')
-            dt = ist.localize(dt)
-        
-        # Convert to target timezone
-        target_tz_obj = pytz.timezone(target_tz)
-        converted_dt = dt.astimezone(target_tz_obj)
-        
-        return converted_dt.isoformat()
-    except Exception as e:
-        logger.error(f"Error converting timezone: {e}")
-        return dt_str
+def convert_timezone(epoch: int, target_tz: str = "UTC") -> str:
+    """Convert a unix timestamp to an ISO datetime in the target timezone"""
+    return datetime.fromtimestamp(epoch, _zi(target_tz)).isoformat()
+
+def valid_timezone(
+    timezone: str = Query("Asia/Kolkata", description="Timezone for class times")
+) -> str:
+    """Timezone query parameter, rejected with 422 if it is not a known zone"""
+    if timezone not in _VALID_TZS:
+        raise HTTPException(status_code=422, detail="Unknown timezone")
+    return timezone
 
 
 
@@ -143,8 +391,10 @@ async def read_root():
     """Health check endpoint"""
     return {"message": "Fitness Studio Booking API", "status": "running"}
 
-@app.get("/classes", response_model=List[ClassResponse])
-async def get_classes(timezone: str = Query("Asia/Kolkata", description="Timezone for class times")):
+# Endpoints that touch SQLite are plain functions, so FastAPI runs them in its
+# threadpool and the blocking database calls never stall the event loop
+@app.get("/classes", responses={200: {"model": List[ClassResponse]}})
+def get_classes(timezone: str = Depends(valid_timezone)):
     """
     Get all upcoming fitness classes
     
@@ -154,32 +404,39 @@ async def get_classes(timezone: str = Query("Asia/Kolkata", description="Timezon
     Returns:
         List of available classes with their details
     """
+    now_epoch = int(time.time())
+    cache_key = (timezone, now_epoch // CLASSES_CACHE_TTL)
+    with _classes_cache_lock:
+        classes = _classes_cache.get(cache_key)
+        cache_generation = _classes_cache_generation
+    if classes is not None:
+        return classes
+    
     try:
         with get_db() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, name, instructor, datetime, total_slots, available_slots
-                FROM classes
-                WHERE datetime > ?
-                ORDER BY datetime
-            ''', (datetime.now(pytz.UTC).isoformat(),))
+            cursor.execute(SQL_GET_CLASSES, (now_epoch,))
             
+            target_tz = _zi(timezone)
             classes = []
-            for row in cursor.fetchall():
+            for row in iter_rows(cursor):
                 class_data = dict(row)
                 # Convert datetime to requested timezone
-                class_data['datetime'] = convert_timezone(class_data['datetime'], timezone)
-                classes.append(ClassResponse(**class_data))
+                class_data['datetime'] = datetime.fromtimestamp(class_data['datetime'], target_tz).isoformat()
+                classes.append(class_data)
             
-            logger.info(f"Retrieved {len(classes)} classes")
+            logger.info("Retrieved %d classes", len(classes))
+            with _classes_cache_lock:
+                if cache_generation == _classes_cache_generation:
+                    _classes_cache[cache_key] = classes
             return classes
             
     except Exception as e:
-        logger.error(f"Error fetching classes: {e}")
+        logger.error("Error fetching classes: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.post("/book", response_model=dict)
-async def book_class(booking: BookingRequest):
+def book_class(booking: BookingRequest):
     """
     Book a spot in a fitness class
     
@@ -189,68 +446,57 @@ async def book_class(booking: BookingRequest):
     Returns:
         Booking confirmation details
     """
+    now_epoch = int(time.time())
     try:
         with get_db() as conn:
             cursor = conn.cursor()
             
-            # Check if class exists and has available slots
-            cursor.execute('''
-                SELECT id, name, instructor, datetime, available_slots
-                FROM classes
-                WHERE id = ? AND datetime > ?
-            ''', (booking.class_id, datetime.now(pytz.UTC).isoformat()))
+            # Take the write lock up front so the slot check and decrement are atomic
+            cursor.execute("BEGIN IMMEDIATE")
+            
+            # Claim a slot in an upcoming class that still has room
+            cursor.execute(SQL_DEC_SLOTS, (booking.class_id, now_epoch))
             
             class_info = cursor.fetchone()
             if not class_info:
-                raise HTTPException(
-                    status_code=404, 
-                    detail="Class not found or has already occurred"
-                )
-            
-            if class_info['available_slots'] <= 0:
+                cursor.execute(SQL_GET_CLASS_FOR_BOOK, (booking.class_id, now_epoch))
+                
+                if not cursor.fetchone():
+                    raise HTTPException(
+                        status_code=404, 
+                        detail="Class not found or has already occurred"
+                    )
+                
                 raise HTTPException(
                     status_code=400, 
                     detail="No available slots for this class"
                 )
             
-            # Check if user already booked this class
-            cursor.execute('''
-                SELECT id FROM bookings
-                WHERE class_id = ? AND client_email = ?
-            ''', (booking.class_id, booking.client_email))
+            # Create booking, relying on the unique index to reject duplicates
+            cursor.execute(
+                SQL_INSERT_BOOKING,
+                (booking.class_id, booking.client_name, booking.client_email, now_epoch)
+            )
             
-            if cursor.fetchone():
+            if cursor.rowcount == 0:
+                # Rolled back by get_db(), which restores the claimed slot
                 raise HTTPException(
                     status_code=400,
                     detail="You have already booked this class"
                 )
             
-            # Create booking
-            cursor.execute('''
-                INSERT INTO bookings (class_id, client_name, client_email, booking_time)
-                VALUES (?, ?, ?, ?)
-            ''', (booking.class_id, booking.client_name, booking.client_email, 
-                  datetime.now(pytz.UTC).isoformat()))
-            
             booking_id = cursor.lastrowid
-            
-            # Update available slots
-            cursor.execute('''
-                UPDATE classes
-                SET available_slots = available_slots - 1
-                WHERE id = ?
-            ''', (booking.class_id,))
-            
             conn.commit()
+            clear_classes_cache()
             
-            logger.info(f"Booking created: {booking_id} for class {booking.class_id}")
+            logger.info("Booking created: %s for class %s", booking_id, booking.class_id)
             
             return {
                 "message": "Booking successful",
                 "booking_id": booking_id,
                 "class_name": class_info['name'],
                 "instructor": class_info['instructor'],
-                "class_datetime": class_info['datetime'],
+                "class_datetime": convert_timezone(class_info['datetime'], 'Asia/Kolkata'),
                 "client_name": booking.client_name,
                 "client_email": booking.client_email
             }
@@ -258,13 +504,13 @@ async def book_class(booking: BookingRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating booking: {e}")
+        logger.error("Error creating booking: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@app.get("/bookings", response_model=List[BookingResponse])
-async def get_bookings(
+@app.get("/bookings", responses={200: {"model": List[BookingResponse]}})
+def get_bookings(
     email: EmailStr = Query(..., description="Client email to fetch bookings for"),
-    timezone: str = Query("Asia/Kolkata", description="Timezone for class times")
+    timezone: str = Depends(valid_timezone)
 ):
     """
     Get all bookings for a specific email address
@@ -279,36 +525,32 @@ async def get_bookings(
     try:
         with get_db() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT 
-                    b.id, b.class_id, b.client_name, b.client_email, b.booking_time,
-                    c.name as class_name, c.instructor, c.datetime as class_datetime
-                FROM bookings b
-                JOIN classes c ON b.class_id = c.id
-                WHERE b.client_email = ?
-                ORDER BY c.datetime DESC
-            ''', (email,))
+            cursor.execute(SQL_GET_BOOKINGS, (email,))
             
+            target_tz = _zi(timezone)
             bookings = []
-            for row in cursor.fetchall():
+            for row in iter_rows(cursor):
                 booking_data = dict(row)
                 # Convert class datetime to requested timezone
-                booking_data['class_datetime'] = convert_timezone(
-                    booking_data['class_datetime'], timezone
-                )
-                bookings.append(BookingResponse(**booking_data))
+                booking_data['class_datetime'] = datetime.fromtimestamp(
+                    booking_data['class_datetime'], target_tz
+                ).isoformat()
+                booking_data['booking_time'] = datetime.fromtimestamp(
+                    booking_data['booking_time'], _UTC
+                ).isoformat()
+                bookings.append(booking_data)
             
-            logger.info(f"Retrieved {len(bookings)} bookings for {email}")
+            logger.info("Retrieved %d bookings for %s", len(bookings), email)
             return bookings
             
     except Exception as e:
-        logger.error(f"Error fetching bookings: {e}")
+        logger.error("Error fetching bookings: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now(pytz.UTC).isoformat()}
+    return {"status": "healthy", "timestamp": datetime.now(_UTC).isoformat()}
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,9 +1,9 @@
 import pytest
 from fastapi.testclient import TestClient
+import logging
 import os
 import sqlite3
 from datetime import datetime
-import pytz
 
 # Import the app and functions
 import sys
@@ -24,16 +24,13 @@ client = TestClient(get_app())
 @pytest.fixture(scope="function")
 def setup_test_db():
     """Setup test database for each test"""
-    # Use a separate test database
-    test_db = "test_fitness_studio.db"
-    
-    # Remove existing test db if exists
-    if os.path.exists(test_db):
-        os.remove(test_db)
+    # Use a shared in-memory database; it is discarded once the pool closes
+    test_db = "file::memory:?cache=shared"
     
     # Temporarily change the database URL for testing
     import main
     original_db = main.DATABASE_URL
+    main.close_db_pool()
     main.DATABASE_URL = test_db
     
     # Initialize test database
@@ -43,9 +40,48 @@ def setup_test_db():
     yield test_db
     
     # Cleanup
+    main.close_db_pool()
+    main.DATABASE_URL = original_db
+
+@pytest.fixture(scope="function")
+def legacy_db(tmp_path):
+    """Setup a database in the old ISO text timestamp schema"""
+    test_db = str(tmp_path / "legacy_fitness_studio.db")
+    conn = sqlite3.connect(test_db)
+    conn.executescript('''
+        CREATE TABLE classes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            instructor TEXT NOT NULL,
+            datetime TEXT NOT NULL,
+            total_slots INTEGER NOT NULL,
+            available_slots INTEGER NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE bookings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            class_id INTEGER NOT NULL,
+            client_name TEXT NOT NULL,
+            client_email TEXT NOT NULL,
+            booking_time TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (class_id) REFERENCES classes (id)
+        );
+        INSERT INTO classes (id, name, instructor, datetime, total_slots, available_slots)
+        VALUES (7, 'Yoga Flow', 'Priya Sharma', '2025-06-09T07:00:00+05:30', 20, 19);
+        INSERT INTO bookings (id, class_id, client_name, client_email, booking_time)
+        VALUES (3, 7, 'Jane Doe', 'jane.doe@example.com', '2025-06-06T10:30:00.123456+00:00');
+    ''')
+    conn.close()
+    
+    import main
+    original_db = main.DATABASE_URL
+    main.close_db_pool()
+    main.DATABASE_URL = test_db
+    
+    yield test_db
+    
+    main.close_db_pool()
     main.DATABASE_URL = original_db
-    if os.path.exists(test_db):
-        os.remove(test_db)
 
 def test_health_check():
     """Test health check endpoint"""
@@ -79,6 +115,14 @@ def test_get_classes_with_timezone(setup_test_db):
     classes = response.json()
     assert len(classes) > 0
 
+def test_get_classes_invalid_timezone(setup_test_db):
+    """Test that an unknown timezone is rejected"""
+    response = client.get("/classes?timezone=Mars/Olympus_Mons")
+    assert response.status_code == 422
+    
+    response = client.get("/bookings?email=john.doe@example.com&timezone=Mars/Olympus_Mons")
+    assert response.status_code == 422
+
 def test_book_class_success(setup_test_db):
     """Test successful class booking"""
     # First get available classes
@@ -115,6 +159,32 @@ def test_book_nonexistent_class(setup_test_db):
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
+def test_book_full_class(setup_test_db):
+    """Test booking a class with no available slots"""
+    import main
+    with main.get_db() as conn:
+        conn.execute(
+            "UPDATE classes SET datetime = ?, available_slots = 0 WHERE id = 1",
+            (int(datetime.now().timestamp()) + 3600,)
+        )
+        conn.commit()
+    
+    booking_data = {
+        "class_id": 1,
+        "client_name": "John Doe",
+        "client_email": "john.doe@example.com"
+    }
+    
+    response = client.post("/book", json=booking_data)
+    assert response.status_code == 400
+    assert "no available slots" in response.json()["detail"].lower()
+    
+    with main.get_db() as conn:
+        slots = conn.execute("SELECT available_slots FROM classes WHERE id = 1").fetchone()[0]
+        bookings = conn.execute("SELECT COUNT(*) FROM bookings WHERE class_id = 1").fetchone()[0]
+    assert slots == 0
+    assert bookings == 0
+
 def test_duplicate_booking(setup_test_db):
     """Test preventing duplicate bookings"""
     # Get a class
@@ -137,6 +207,81 @@ def test_duplicate_booking(setup_test_db):
     assert response2.status_code == 400
     assert "already booked" in response2.json()["detail"].lower()
 
+def test_duplicate_booking_keeps_slot(setup_test_db):
+    """Test that a rejected duplicate booking does not consume a slot"""
+    classes_response = client.get("/classes")
+    class_id = classes_response.json()[0]["id"]
+    
+    booking_data = {
+        "class_id": class_id,
+        "client_name": "Jane Doe",
+        "client_email": "jane.doe@example.com"
+    }
+    
+    assert client.post("/book", json=booking_data).status_code == 200
+    assert client.post("/book", json=booking_data).status_code == 400
+    
+    classes_response = client.get("/classes")
+    updated_class = next(c for c in classes_response.json() if c["id"] == class_id)
+    assert updated_class["available_slots"] == updated_class["total_slots"] - 1
+
+def test_classes_cache_skips_rows_read_before_booking(setup_test_db, monkeypatch):
+    """Test that a booking committed during a /classes read is visible next call"""
+    import main
+    with main.get_db() as conn:
+        conn.execute(
+            "UPDATE classes SET datetime = ? WHERE id = 1",
+            (int(datetime.now().timestamp()) + 3600,)
+        )
+        conn.commit()
+    main.clear_classes_cache()
+    
+    original_iter_rows = main.iter_rows
+    
+    def iter_rows_with_booking(cursor, size=256):
+        # Read the rows, then let a booking commit before they are returned
+        rows = list(original_iter_rows(cursor, size))
+        monkeypatch.setattr(main, "iter_rows", original_iter_rows)
+        response = client.post("/book", json={
+            "class_id": 1,
+            "client_name": "Jane Doe",
+            "client_email": "jane.doe@example.com"
+        })
+        assert response.status_code == 200
+        yield from rows
+    
+    monkeypatch.setattr(main, "iter_rows", iter_rows_with_booking)
+    stale_class = next(c for c in client.get("/classes").json() if c["id"] == 1)
+    
+    updated_class = next(c for c in client.get("/classes").json() if c["id"] == 1)
+    assert updated_class["available_slots"] == stale_class["available_slots"] - 1
+
+def test_init_db_removes_duplicate_bookings(setup_test_db):
+    """Test that duplicates from before the unique index are cleaned up on init"""
+    import main
+    with main.get_db() as conn:
+        conn.execute("DROP INDEX idx_bookings_unique")
+        conn.executemany('''
+            INSERT INTO bookings (class_id, client_name, client_email, booking_time)
+            VALUES (1, 'Jane Doe', 'jane.doe@example.com', ?)
+        ''', [(1700000000,), (1700000001,)])
+        conn.execute("UPDATE classes SET available_slots = total_slots - 2 WHERE id = 1")
+        conn.commit()
+    
+    init_db = get_init_db()
+    init_db()
+    
+    with main.get_db() as conn:
+        bookings = conn.execute("SELECT booking_time FROM bookings WHERE class_id = 1").fetchall()
+        slots = conn.execute("SELECT total_slots, available_slots FROM classes WHERE id = 1").fetchone()
+        index = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_bookings_unique'"
+        ).fetchone()
+    
+    assert [row["booking_time"] for row in bookings] == [1700000000]
+    assert slots["available_slots"] == slots["total_slots"] - 1
+    assert index is not None
+
 def test_invalid_booking_data(setup_test_db):
     """Test booking with invalid data"""
     # Missing required fields
@@ -215,5 +360,75 @@ def test_available_slots_decrease(setup_test_db):
     
     assert updated_class["available_slots"] == initial_slots - 1
 
+def test_init_db_migrates_legacy_schema(legacy_db):
+    """Test that ISO text timestamps are migrated to unix seconds"""
+    import main
+    init_db = get_init_db()
+    init_db()
+    
+    with main.get_db() as conn:
+        class_row = conn.execute("SELECT * FROM classes WHERE id = 7").fetchone()
+        booking_row = conn.execute("SELECT * FROM bookings WHERE id = 3").fetchone()
+        foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        legacy_tables = conn.execute(
+            "SELECT name FROM sqlite_master WHERE name LIKE '%_legacy'"
+        ).fetchall()
+    
+    assert class_row["datetime"] == 1749432600
+    assert class_row["available_slots"] == 19
+    assert booking_row["class_id"] == 7
+    assert booking_row["booking_time"] == 1749205800
+    assert foreign_keys == 1
+    assert legacy_tables == []
+
+def test_init_db_failed_migration_restores_foreign_keys(legacy_db):
+    """Test that a failed migration rolls back and re-enables foreign keys"""
+    conn = sqlite3.connect(legacy_db)
+    conn.execute('''
+        INSERT INTO classes (name, instructor, datetime, total_slots, available_slots)
+        VALUES ('Broken', 'Nobody', 'not a date', 10, 10)
+    ''')
+    conn.commit()
+    conn.close()
+    
+    import main
+    init_db = get_init_db()
+    with pytest.raises(sqlite3.IntegrityError):
+        init_db()
+    
+    pool = main.get_db_pool()
+    connections = [pool.get() for _ in range(main.DB_POOL_SIZE)]
+    try:
+        assert all(c.execute("PRAGMA foreign_keys").fetchone()[0] == 1 for c in connections)
+        columns = connections[0].execute("PRAGMA table_info(classes)").fetchall()
+        assert {col["name"]: col["type"] for col in columns}["datetime"] == "TEXT"
+    finally:
+        for c in connections:
+            pool.put(c)
+
+def test_unknown_log_level_falls_back_to_info():
+    """Test that an invalid LOG_LEVEL does not break importing the app"""
+    import subprocess
+    result = subprocess.run(
+        [sys.executable, "-c", "import logging, main; print(logging.getLogger().level)"],
+        env={**os.environ, "LOG_LEVEL": "verbose"},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert result.stdout.strip() == str(logging.INFO)
+    assert "Unknown LOG_LEVEL 'VERBOSE'" in result.stderr
+
+def test_pool_close_includes_checked_out_connections():
+    """Test that a connection returned after the pool closes is closed too"""
+    import main
+    pool = main.ConnectionPool(":memory:", size=2)
+    conn = pool.get()
+    pool.close()
+    pool.put(conn)
+    
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
 if __name__ == "__main__":
     pytest.main(["-v"])
\ No newline at end of file